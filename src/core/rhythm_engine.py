@@ -5,10 +5,11 @@ Environmental consciousness through autonomous breathing patterns with daily per
 """
 
 import datetime
+import functools
 import math
-import calendar
-from typing import Dict, Tuple, List, Optional, Union
-from dataclasses import dataclass
+import time
+from typing import Dict, NamedTuple, Tuple, List, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -17,12 +18,292 @@ class TrackType(Enum):
     OUTDOOR = "outdoor"
 
 
+# Kelvin -> RGB lookup table
+# Anchor points preserve the original thermal character at each temperature band;
+# the table linearly interpolates between them at 1K steps for continuous output.
+_KELVIN_LUT_MIN = 800
+_KELVIN_LUT_MAX = 3500
+_KELVIN_ANCHORS = (
+    (800, (0.1, 0.0, 0.0)),    # Very dark red (below silicon glow)
+    (1000, (0.3, 0.05, 0.0)),  # Dark reddish-black
+    (1500, (0.8, 0.2, 0.0)),   # Deep red
+    (2000, (1.0, 0.4, 0.1)),   # Orange-red
+    (2500, (1.0, 0.7, 0.3)),   # Warm amber
+    (3000, (1.0, 0.9, 0.7)),   # Soft white
+    (3500, (0.8, 0.9, 1.0)),   # Sky blue (alarm territory)
+)
+
+
+def _build_kelvin_lut() -> Tuple[Tuple[float, float, float], ...]:
+    """Build the Kelvin lookup table, one (r, g, b) row per 1K step"""
+    rows = []
+    for (low_k, low_rgb), (high_k, high_rgb) in zip(_KELVIN_ANCHORS, _KELVIN_ANCHORS[1:]):
+        span = high_k - low_k
+        for k in range(low_k, high_k):
+            factor = (k - low_k) / span
+            rows.append(tuple(
+                low_rgb[channel] + factor * (high_rgb[channel] - low_rgb[channel])
+                for channel in range(3)
+            ))
+    rows.append(_KELVIN_ANCHORS[-1][1])
+    return tuple(rows)
+
+
+_KELVIN_LUT = _build_kelvin_lut()
+
+
+# Free-function kernels for the per-frame math. Keeping these at module level
+# avoids attribute lookups in the hot path and keeps each one a pure scalar
+# function, so they stay compatible with JIT compilers on builds that have one.
+
+def _kelvin_to_rgb(temp_k: float) -> Tuple[float, float, float]:
+    """Scalar kernel: color temperature to RGB via the precomputed LUT"""
+    clamped = max(_KELVIN_LUT_MIN, min(_KELVIN_LUT_MAX, temp_k))
+    index = int(clamped) - _KELVIN_LUT_MIN
+    fraction = clamped - int(clamped)
+    low = _KELVIN_LUT[index]
+    if fraction == 0.0:
+        return low
+    high = _KELVIN_LUT[index + 1]
+    return (
+        low[0] + fraction * (high[0] - low[0]),
+        low[1] + fraction * (high[1] - low[1]),
+        low[2] + fraction * (high[2] - low[2]),
+    )
+
+
+# Reciprocals of the muggy (56-75F) and dryness (20-45F) dewpoint ranges,
+# precomputed so the factor kernels multiply instead of divide.
+_INV_MUGGY_RANGE = 1.0 / 19.0
+_INV_DRYNESS_RANGE = 1.0 / 25.0
+
+# Barometric pressure normalization (inHg around standard sea level) and cloud
+# cover percentage scaling, as reciprocal multipliers for the same reason.
+_PRESSURE_REFERENCE = 29.92
+_INV_PRESSURE_SCALE = 1.0 / 2.0
+_INV_CLOUD_SCALE = 1.0 / 100.0
+
+# 8-bit channel normalization, likewise as a multiplier
+_INV_255 = 1.0 / 255.0
+
+# Full circle in radians, and the bpm -> rad/s conversion for the phase update
+_TWO_PI = 2.0 * math.pi
+_TWO_PI_OVER_60 = _TWO_PI / 60.0
+
+
+def _muggy_factor(dewpoint_f: float) -> float:
+    """Scalar kernel: dewpoint 56F+ fade-in, max discomfort ~75F"""
+    return max(0.0, min(1.0, (dewpoint_f - 56.0) * _INV_MUGGY_RANGE))
+
+
+def _dryness_factor(dewpoint_f: float) -> float:
+    """Scalar kernel: crisp air effect for low dewpoints"""
+    return max(0.0, min(1.0, (45.0 - dewpoint_f) * _INV_DRYNESS_RANGE))
+
+
+def _kelvin_base_color(exhale_k: float, inhale_k: float,
+                       breath_factor: float) -> Tuple[Tuple[float, float, float], float]:
+    """Scalar kernel: interpolate the breath temperature and convert to RGB"""
+    current_temp = exhale_k + breath_factor * (inhale_k - exhale_k)
+    return _kelvin_to_rgb(current_temp), current_temp
+
+
+def _grey_base_color(exhale_rgb: Tuple[float, float, float],
+                     inhale_rgb: Tuple[float, float, float],
+                     breath_factor: float) -> Tuple[float, float, float]:
+    """Scalar kernel: interpolate between exhale and inhale RGB for grey breathing"""
+    return (
+        exhale_rgb[0] + breath_factor * (inhale_rgb[0] - exhale_rgb[0]),
+        exhale_rgb[1] + breath_factor * (inhale_rgb[1] - exhale_rgb[1]),
+        exhale_rgb[2] + breath_factor * (inhale_rgb[2] - exhale_rgb[2]),
+    )
+
+
+# Breath apex window for the humidity flash: |sin(phase)| above this threshold,
+# i.e. phase within ~acos(0.95) = 0.32 rad of either apex
+_FLASH_SIN_THRESHOLD = 0.95
+
+
+def _finalize_frame(red: float, green: float, blue: float, breath_sin: float,
+                    heartbeat_phase: bool, env_effects: 'EnvEffects') -> Tuple[float, float, float, float]:
+    """Scalar kernel: breathing brightness, heartbeat overlay, and flash override"""
+    breathing_multiplier = (0.8 + 0.2 * breath_sin) * (1.0 + env_effects.depth_adjustment)
+    heartbeat_additive = 0.2 if heartbeat_phase else 0.0
+
+    if env_effects.extreme_humidity_flash and (
+            breath_sin > _FLASH_SIN_THRESHOLD or breath_sin < -_FLASH_SIN_THRESHOLD):
+        # Circuit overload flash at breath apex (reuse sympathetic lightning colors)
+        red, green, blue = 0.8, 0.9, 1.0  # Blue-tinged white
+        breathing_multiplier = 1.0
+        heartbeat_additive = 0.0
+
+    brightness = max(min(breathing_multiplier + heartbeat_additive, 1.0), 0.1)
+    return red, green, blue, brightness
+
+
+# Breath-phase quantization for the per-day waveform tables. 1024 steps over a
+# full cycle keeps the step under 0.4 degrees of phase — well below anything an
+# LED viewer can perceive — and makes the index wrap a bit-mask.
+_PHASE_STEPS = 1024
+_PHASE_MASK = _PHASE_STEPS - 1
+_PHASE_STEP_RAD = _TWO_PI / _PHASE_STEPS
+_PHASE_INDEX_SCALE = _PHASE_STEPS / _TWO_PI
+
+
+def _build_phase_table(exhale_k: float, inhale_k: float) -> Tuple[Tuple[float, float, float, float, float], ...]:
+    """Sample a module's Kelvin breath waveform into a phase-indexed table
+
+    For a fixed day the Kelvin endpoints are constant, so the base color and
+    breath sine depend only on the phase. Each row carries
+    (r, g, b, temperature_k, breath_sin); the per-frame path then reduces to
+    one index plus _finalize_frame for the inputs that stay dynamic
+    (environment, heartbeat).
+    """
+    rows = []
+    for step in range(_PHASE_STEPS):
+        breath_sin = math.sin(step * _PHASE_STEP_RAD)
+        (red, green, blue), current_temp = _kelvin_base_color(
+            exhale_k, inhale_k, (breath_sin + 1.0) / 2.0
+        )
+        rows.append((red, green, blue, current_temp, breath_sin))
+    return tuple(rows)
+
+
+def _build_grey_phase_table(exhale_rgb: Tuple[float, float, float],
+                            inhale_rgb: Tuple[float, float, float]
+                            ) -> Tuple[Tuple[float, float, float, float, float], ...]:
+    """Sample a grey (RGB) breath waveform into a phase-indexed table
+
+    Same row layout as _build_phase_table so the per-frame path is identical
+    for both breathing modes; the temperature column carries the approximate
+    2200K used for logging on grey days.
+    """
+    rows = []
+    for step in range(_PHASE_STEPS):
+        breath_sin = math.sin(step * _PHASE_STEP_RAD)
+        red, green, blue = _grey_base_color(
+            exhale_rgb, inhale_rgb, (breath_sin + 1.0) / 2.0
+        )
+        rows.append((red, green, blue, 2200.0, breath_sin))
+    return tuple(rows)
+
+
+def _days_since_winter_solstice(date: datetime.date) -> int:
+    """Days since the most recent winter solstice (approximated as Dec 21)
+
+    Pure ordinal arithmetic — no timedelta objects on this path.
+    """
+    ordinal = date.toordinal()
+    solstice_ordinal = datetime.date(date.year, 12, 21).toordinal()
+    if ordinal < solstice_ordinal:
+        solstice_ordinal = datetime.date(date.year - 1, 12, 21).toordinal()
+    return ordinal - solstice_ordinal
+
+
+def _interpolate_solstice_coefficients(days: int, winter_coeff: float, summer_coeff: float) -> float:
+    """Cosine interpolation between solstice coefficients across the year"""
+    # 1.0 at the winter solstice, 0.0 at the summer solstice, smooth at both
+    seasonal_phase = (1.0 + math.cos(_TWO_PI * days / 365.25)) / 2.0
+    return summer_coeff + (winter_coeff - summer_coeff) * seasonal_phase
+
+
+@functools.lru_cache(maxsize=2)
+def _seasonal_coefficient_table(winter_coeff: float, summer_coeff: float) -> Tuple[float, ...]:
+    """366-entry coefficient table indexed by days since the winter solstice
+
+    The cosine interpolation is a pure function of the day offset, so the
+    whole year is sampled once per coefficient pair (in practice: once) and
+    date lookups become a table index. 366 entries cover leap-year spans.
+    """
+    return tuple(
+        _interpolate_solstice_coefficients(days, winter_coeff, summer_coeff)
+        for days in range(366)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _seasonal_coefficient(current_date: datetime.date, winter_coeff: float,
+                          summer_coeff: float) -> float:
+    """Memoized seasonal coefficient — one live entry per day in practice"""
+    table = _seasonal_coefficient_table(winter_coeff, summer_coeff)
+    return table[_days_since_winter_solstice(current_date)]
+
+
+@functools.lru_cache(maxsize=4)
+def _environmental_effects(dewpoint: float, barometric_pressure: float,
+                           cloud_cover_percentage: float) -> 'EnvEffects':
+    """Scalar kernel: weather-based modifications to breathing patterns
+
+    Memoized on the inputs: sensors update at poll cadence (seconds) while this
+    runs at render cadence, so nearly every call is a cache hit.
+    """
+    muggy_factor = _muggy_factor(dewpoint)
+    dryness_factor = _dryness_factor(dewpoint)
+    pressure_factor = (barometric_pressure - _PRESSURE_REFERENCE) * _INV_PRESSURE_SCALE  # normalized
+    cloud_factor = cloud_cover_percentage * _INV_CLOUD_SCALE
+
+    # Breathing effort (muggy nights = more labored)
+    effort_multiplier = 1.0 + (muggy_factor * 0.15)
+
+    # Breathing depth (pressure-based) - this affects brown noise amplitude
+    depth_adjustment = pressure_factor * 0.1
+    depth_adjustment += dryness_factor * 0.1  # Crisp air = deeper breathing
+    depth_adjustment -= muggy_factor * 0.1    # Muggy air = shallower breathing
+
+    # Saturation adjustment
+    saturation_adjustment = (muggy_factor * 0.2) - (dryness_factor * 0.15) + (cloud_factor * 0.1)
+
+    return EnvEffects(
+        depth_adjustment=depth_adjustment,
+        saturation_adjustment=saturation_adjustment,
+        effort_multiplier=effort_multiplier,
+        extreme_humidity_flash=dewpoint >= 79.0,  # Circuit overload effect
+        brown_noise_amplitude_factor=1.0 + depth_adjustment  # For audio system integration
+    )
+
+
+# Lunar breathing rate constants, hoisted so the per-tick kernel below avoids
+# dict lookups and a division. RhythmEngineCore.LUNAR_BREATHING_RATE exposes
+# the same values to callers.
+_LUNAR_BASE_BPM = 10.0
+_LUNAR_MAX_BPM = 12.0
+_LUNAR_PERIGEE_KM = 356500
+_LUNAR_APOGEE_KM = 406700
+_LUNAR_INV_RANGE = 1.0 / (_LUNAR_APOGEE_KM - _LUNAR_PERIGEE_KM)
+_LUNAR_RATE_SPAN = _LUNAR_MAX_BPM - _LUNAR_BASE_BPM
+
+
+@functools.lru_cache(maxsize=2)
+def _lunar_breathing_rate(lunar_distance_km: float) -> float:
+    """Scalar kernel: breathing rate from lunar distance (perigee/apogee cycle)
+
+    Memoized on the distance, which changes on ephemeris cadence while this is
+    called several times per tick.
+    """
+    # Normalize lunar distance to 0.0-1.0 range (0 = apogee, 1 = perigee)
+    distance_factor = (_LUNAR_APOGEE_KM - lunar_distance_km) * _LUNAR_INV_RANGE
+    if distance_factor < 0.0:
+        distance_factor = 0.0
+    elif distance_factor > 1.0:
+        distance_factor = 1.0
+
+    # Faster at perigee (closer), slower at apogee (farther)
+    return _LUNAR_BASE_BPM + distance_factor * _LUNAR_RATE_SPAN
+
+
 class BreathingMode(Enum):
     KELVIN_BREATHING = "kelvin_breathing"
     RGB_BREATHING = "rgb_breathing"
 
 
-@dataclass
+# Module-level aliases for the enum members checked in per-frame code: enum
+# members are singletons, so an identity test against a module global beats
+# Enum.__eq__ plus two class-dict attribute lookups.
+_RGB_BREATHING = BreathingMode.RGB_BREATHING
+_INDOOR = TrackType.INDOOR
+
+
+@dataclass(slots=True, frozen=True)
 class EnvironmentalData:
     """Weather and environmental sensor data"""
     temperature: float
@@ -35,6 +316,35 @@ class EnvironmentalData:
 
 
 @dataclass
+class EnvironmentalBatch:
+    """Structure-of-arrays view of many environmental samples
+
+    Column layout keeps each field contiguous so batched kernels can sweep one
+    list per quantity instead of chasing per-sample attribute lookups.
+    """
+    temperature: List[float]
+    humidity: List[float]
+    dewpoint: List[float]
+    barometric_pressure: List[float]
+    cloud_cover_percentage: List[float]
+    wind_speed: List[float]
+    air_quality_index: List[float]
+
+    @classmethod
+    def from_samples(cls, samples: List[EnvironmentalData]) -> 'EnvironmentalBatch':
+        """Repack per-sample EnvironmentalData records into column lists"""
+        return cls(
+            temperature=[sample.temperature for sample in samples],
+            humidity=[sample.humidity for sample in samples],
+            dewpoint=[sample.dewpoint for sample in samples],
+            barometric_pressure=[sample.barometric_pressure for sample in samples],
+            cloud_cover_percentage=[sample.cloud_cover_percentage for sample in samples],
+            wind_speed=[sample.wind_speed for sample in samples],
+            air_quality_index=[sample.air_quality_index for sample in samples],
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class AstronomicalData:
     """Daily astronomical events and calculations"""
     sunrise: datetime.datetime
@@ -56,19 +366,81 @@ class AstronomicalData:
     lunar_distance_km: float  # For breathing rate calculations
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DailyColorSchedule:
-    """Color schedule for a specific day of the week"""
+    """Color schedule for a specific day of the week
+
+    Breathing modules carry their Kelvin range as an (exhale_k, inhale_k) tuple.
+    """
     mode: BreathingMode
-    wakeful_breathing: Optional[Dict[str, Union[int, List[int]]]] = None
-    sleep_breathing: Optional[Dict[str, Union[int, List[int]]]] = None
-    meditation: Optional[Dict[str, Union[int, List[int]]]] = None
-    inebriated: Optional[Dict[str, Union[int, List[int]]]] = None
+    wakeful_breathing: Optional[Tuple[int, int]] = None
+    sleep_breathing: Optional[Tuple[int, int]] = None
+    meditation: Optional[Tuple[int, int]] = None
+    inebriated: Optional[Tuple[int, int]] = None
     exhale_rgb: Optional[List[int]] = None
     inhale_rgb: Optional[List[int]] = None
     shapeshift_enabled: bool = False
     shapeshift_inheritance: Optional[str] = None
     description: str = ""
+    # Normalized (0.0-1.0) copies of the RGB pair, computed once at construction
+    exhale_rgb_norm: Optional[Tuple[float, float, float]] = field(default=None, init=False)
+    inhale_rgb_norm: Optional[Tuple[float, float, float]] = field(default=None, init=False)
+
+    def __post_init__(self):
+        if self.exhale_rgb is not None:
+            object.__setattr__(self, 'exhale_rgb_norm',
+                               tuple(value * _INV_255 for value in self.exhale_rgb))
+        if self.inhale_rgb is not None:
+            object.__setattr__(self, 'inhale_rgb_norm',
+                               tuple(value * _INV_255 for value in self.inhale_rgb))
+
+
+class EnvEffects(NamedTuple):
+    """Weather-based breathing modifications (hot-path return shape)"""
+    depth_adjustment: float
+    saturation_adjustment: float
+    effort_multiplier: float
+    extreme_humidity_flash: bool
+    brown_noise_amplitude_factor: float
+
+
+def pack_rgba(rgb: Tuple[float, float, float], brightness: float) -> int:
+    """Quantize a normalized frame to a single 0xAARRGGBB integer word
+
+    LED drivers take 8-bit PWM per channel, so the brightness is folded into
+    the channels and the result fits one word for the transport layer instead
+    of four boxed floats. Inputs are already clamped to [0, 1] upstream.
+    """
+    scale = brightness * 255.0
+    return (
+        0xFF000000
+        | (int(rgb[0] * scale + 0.5) << 16)
+        | (int(rgb[1] * scale + 0.5) << 8)
+        | int(rgb[2] * scale + 0.5)
+    )
+
+
+class RGBOutput(NamedTuple):
+    """Complete per-frame output (hot-path return shape)"""
+    rgb: Tuple[float, float, float]
+    brightness: float
+    temperature_k: float
+    environmental_effects: EnvEffects
+    breathing_rate_bpm: float
+    day_schedule: str
+    track_type: str
+    brown_noise_amplitude: float
+    packed: int
+
+
+# Neutral effects for paths that run without live weather data
+_NEUTRAL_ENV_EFFECTS = EnvEffects(
+    depth_adjustment=0.0,
+    saturation_adjustment=0.0,
+    effort_multiplier=1.0,
+    extreme_humidity_flash=False,
+    brown_noise_amplitude_factor=1.0
+)
 
 
 class RhythmEngineCore:
@@ -86,58 +458,72 @@ class RhythmEngineCore:
         ),
         'monday': DailyColorSchedule(
             mode=BreathingMode.KELVIN_BREATHING,
-            wakeful_breathing={'exhale_k': 3400, 'inhale_k': 2600},
-            sleep_breathing={'exhale_k': 2600, 'inhale_k': 2200},
-            meditation={'exhale_k': 3400, 'inhale_k': 2600},
-            inebriated={'exhale_k': 2550, 'inhale_k': 1950},
+            wakeful_breathing=(3400, 2600),
+            sleep_breathing=(2600, 2200),
+            meditation=(3400, 2600),
+            inebriated=(2550, 1950),
             description="Monday thermal range - beginning the week's warming progression"
         ),
         'tuesday': DailyColorSchedule(
             mode=BreathingMode.KELVIN_BREATHING,
-            wakeful_breathing={'exhale_k': 3000, 'inhale_k': 2200},
-            sleep_breathing={'exhale_k': 2600, 'inhale_k': 2200},
-            meditation={'exhale_k': 3000, 'inhale_k': 2200},
-            inebriated={'exhale_k': 2350, 'inhale_k': 1750},
+            wakeful_breathing=(3000, 2200),
+            sleep_breathing=(2600, 2200),
+            meditation=(3000, 2200),
+            inebriated=(2350, 1750),
             description="Tuesday thermal range - continued warming"
         ),
         'wednesday': DailyColorSchedule(
             mode=BreathingMode.KELVIN_BREATHING,
-            wakeful_breathing={'exhale_k': 2200, 'inhale_k': 1400},
-            sleep_breathing={'exhale_k': 1800, 'inhale_k': 1400},
-            meditation={'exhale_k': 2200, 'inhale_k': 1400},
-            inebriated={'exhale_k': 1750, 'inhale_k': 1150},
+            wakeful_breathing=(2200, 1400),
+            sleep_breathing=(1800, 1400),
+            meditation=(2200, 1400),
+            inebriated=(1750, 1150),
             description="Wednesday thermal range - mid-week depth"
         ),
         'thursday': DailyColorSchedule(
             mode=BreathingMode.KELVIN_BREATHING,
-            wakeful_breathing={'exhale_k': 1800, 'inhale_k': 1000},
-            sleep_breathing={'exhale_k': 1400, 'inhale_k': 1000},
-            meditation={'exhale_k': 1800, 'inhale_k': 1000},
-            inebriated={'exhale_k': 1550, 'inhale_k': 950},
+            wakeful_breathing=(1800, 1000),
+            sleep_breathing=(1400, 1000),
+            meditation=(1800, 1000),
+            inebriated=(1550, 950),
             description="Thursday thermal range - deepest warmth before weekend"
         ),
         'friday': DailyColorSchedule(
             mode=BreathingMode.KELVIN_BREATHING,
-            wakeful_breathing={'exhale_k': 2200, 'inhale_k': 1400},
-            sleep_breathing={'exhale_k': 1800, 'inhale_k': 1400},
-            meditation={'exhale_k': 2200, 'inhale_k': 1400},
-            inebriated={'exhale_k': 1750, 'inhale_k': 1150},
+            wakeful_breathing=(2200, 1400),
+            sleep_breathing=(1800, 1400),
+            meditation=(2200, 1400),
+            inebriated=(1750, 1150),
             shapeshift_enabled=True,
             shapeshift_inheritance="use_daily_colors_as_base",
             description="Friday - shapeshift capability with inherited daily thermal range"
         ),
         'saturday': DailyColorSchedule(
             mode=BreathingMode.KELVIN_BREATHING,
-            wakeful_breathing={'exhale_k': 3400, 'inhale_k': 1000},
-            sleep_breathing={'exhale_k': 2600, 'inhale_k': 1000},
-            meditation={'exhale_k': 3400, 'inhale_k': 1000},
-            inebriated={'exhale_k': 2550, 'inhale_k': 950},
+            wakeful_breathing=(3400, 1000),
+            sleep_breathing=(2600, 1000),
+            meditation=(3400, 1000),
+            inebriated=(2550, 950),
             shapeshift_enabled=True,
             shapeshift_inheritance="use_daily_colors_as_base",
             description="Saturday - full spectrum thermal range and shapeshift capability"
         )
     }
     
+    # Daily schedules indexed by date.weekday() (Monday=0 .. Sunday=6)
+    _WEEKDAY_TABLE = (
+        WEEKLY_SCHEDULE['monday'],
+        WEEKLY_SCHEDULE['tuesday'],
+        WEEKLY_SCHEDULE['wednesday'],
+        WEEKLY_SCHEDULE['thursday'],
+        WEEKLY_SCHEDULE['friday'],
+        WEEKLY_SCHEDULE['saturday'],
+        WEEKLY_SCHEDULE['sunday'],
+    )
+
+    # Weekend flags indexed by date.weekday(), same layout as _WEEKDAY_TABLE
+    _IS_WEEKEND = (False,) * 5 + (True, True)
+
     # Seasonal coefficients
     WINTER_SOLSTICE_COEFFICIENT = 1.34  # +34%
     SUMMER_SOLSTICE_COEFFICIENT = 0.77  # -23%
@@ -145,13 +531,16 @@ class RhythmEngineCore:
     
     # Lunar breathing rate settings (separate from color temperature)
     LUNAR_BREATHING_RATE = {
-        'base_rate_bpm': 10.0,     # At apogee (moon farthest)
-        'max_rate_bpm': 12.0,      # At perigee (moon closest)
-        'cycle_days': 27.3,        # Anomalistic lunar month
-        'perigee_distance_km': 356500,  # Approximate perigee distance
-        'apogee_distance_km': 406700    # Approximate apogee distance
+        'base_rate_bpm': _LUNAR_BASE_BPM,      # At apogee (moon farthest)
+        'max_rate_bpm': _LUNAR_MAX_BPM,        # At perigee (moon closest)
+        'cycle_days': 27.3,                    # Anomalistic lunar month
+        'perigee_distance_km': _LUNAR_PERIGEE_KM,  # Approximate perigee distance
+        'apogee_distance_km': _LUNAR_APOGEE_KM     # Approximate apogee distance
     }
     
+    # Breathing modules carried by each day's schedule
+    _MODULE_NAMES = ('wakeful_breathing', 'sleep_breathing', 'meditation', 'inebriated')
+
     def __init__(self, track_type: TrackType = TrackType.INDOOR):
         self.track_type = track_type
         self.fallback_layers = [
@@ -160,236 +549,344 @@ class RhythmEngineCore:
             'cached_data',
             'emergency_breathing'
         ]
+        # Bound once so the cascade loops over callables instead of
+        # re-matching layer names every pass
+        self._fallback_fns = (
+            self.fetch_api_data,
+            self.calculate_local_solar_times,
+            self.load_cached_astronomical_data,
+            self.activate_priority_99_breathing,
+        )
+        # Once-per-day derived state, refreshed when the date rolls over
+        self._cached_today: Optional[datetime.date] = None
+        self._cached_day_schedule: Optional[DailyColorSchedule] = None
+        self._module_endpoints: Dict[str, Optional[Tuple[float, float]]] = {}
+        self._phase_tables: Dict[str, Tuple[Tuple[float, float, float, float, float], ...]] = {}
     
     def kelvin_to_rgb(self, temp_k: float) -> Tuple[float, float, float]:
-        """Convert color temperature to RGB values (0.0-1.0 range)"""
-        if temp_k < 800:
-            return (0.1, 0.0, 0.0)    # Very dark red (below silicon glow)
-        elif temp_k < 1000:
-            return (0.3, 0.05, 0.0)   # Dark reddish-black
-        elif temp_k < 1500:
-            return (0.8, 0.2, 0.0)    # Deep red
-        elif temp_k < 2000:
-            return (1.0, 0.4, 0.1)    # Orange-red
-        elif temp_k < 2500:
-            return (1.0, 0.7, 0.3)    # Warm amber
-        elif temp_k < 3000:
-            return (1.0, 0.9, 0.7)    # Soft white
-        elif temp_k >= 3000:
-            return (0.8, 0.9, 1.0)    # Sky blue (alarm territory)
-        
-        # TODO: Smooth interpolation between these points
-        return (1.0, 0.7, 0.3)  # Default warm amber
+        """Convert color temperature to RGB values (0.0-1.0 range) via the precomputed LUT"""
+        return _kelvin_to_rgb(temp_k)
+
+    def kelvin_to_rgb_batch(self, temps_k: List[float]) -> List[Tuple[float, float, float]]:
+        """Element-wise kelvin_to_rgb over a sequence of temperatures"""
+        return [_kelvin_to_rgb(temp_k) for temp_k in temps_k]
+
+    def calculate_muggy_factor_batch(self, dewpoints_f: List[float]) -> List[float]:
+        """Element-wise calculate_muggy_factor over a sequence of dewpoints"""
+        return [_muggy_factor(dewpoint_f) for dewpoint_f in dewpoints_f]
     
     def rgb_to_normalized(self, rgb_values: List[int]) -> Tuple[float, float, float]:
         """Convert RGB integer values (0-255) to normalized float values (0.0-1.0)"""
-        return tuple(value / 255.0 for value in rgb_values)
+        return tuple(value * _INV_255 for value in rgb_values)
     
     def get_current_day_schedule(self, current_date: datetime.date, track_type: TrackType) -> DailyColorSchedule:
         """Get the color schedule for the current day of the week"""
-        day_name = calendar.day_name[current_date.weekday()].lower()
-        
+        weekday = current_date.weekday()
+
         # Special case: Indoor track on Sunday uses Saturday colors ("Paganism between the sheets")
-        if day_name == 'sunday' and track_type == TrackType.INDOOR:
+        if weekday == 6 and track_type is _INDOOR:
             return self.WEEKLY_SCHEDULE['saturday']
-        
-        return self.WEEKLY_SCHEDULE[day_name]
-    
+
+        return self._WEEKDAY_TABLE[weekday]
+
+    def _daily_state(self, current_date: datetime.date) -> DailyColorSchedule:
+        """Cached per-day schedule lookup, rebuilt only when the date changes
+
+        The schedule (and everything derived from it) is constant for a whole
+        day, so the per-frame paths consult this instead of re-deriving it.
+        """
+        if current_date != self._cached_today:
+            self._refresh_daily_state(current_date)
+        return self._cached_day_schedule
+
+    def _refresh_daily_state(self, current_date: datetime.date):
+        """Rebuild the once-per-day derived state for a new date"""
+        self._cached_today = current_date
+        self._cached_day_schedule = self.get_current_day_schedule(current_date, self.track_type)
+
+        # Specialize per-module Kelvin endpoints for the day so the per-frame
+        # paths index a prebuilt dict instead of getattr + key lookups
+        self._module_endpoints = {
+            name: getattr(self._cached_day_schedule, name, None)
+            for name in self._MODULE_NAMES
+        }
+
+        # Phase-indexed waveform tables: the color endpoints are fixed for the
+        # day, so the base color per module collapses to one table fetch per
+        # frame. Grey days share a single table across every module, which
+        # also removes the breathing-mode branch from the per-frame path.
+        if self._cached_day_schedule.mode is _RGB_BREATHING:
+            grey_table = _build_grey_phase_table(
+                self._cached_day_schedule.exhale_rgb_norm,
+                self._cached_day_schedule.inhale_rgb_norm,
+            )
+            self._phase_tables = {name: grey_table for name in self._MODULE_NAMES}
+        else:
+            self._phase_tables = {
+                name: _build_phase_table(endpoints[0], endpoints[1])
+                for name, endpoints in self._module_endpoints.items()
+                if endpoints
+            }
+
     def calculate_lunar_breathing_rate(self, astronomical_data: AstronomicalData) -> float:
         """Calculate breathing rate based on lunar distance (perigee/apogee cycle)"""
-        lunar_distance = astronomical_data.lunar_distance_km
-        perigee_distance = self.LUNAR_BREATHING_RATE['perigee_distance_km']
-        apogee_distance = self.LUNAR_BREATHING_RATE['apogee_distance_km']
-        
-        # Normalize lunar distance to 0.0-1.0 range (0 = apogee, 1 = perigee)
-        distance_factor = (apogee_distance - lunar_distance) / (apogee_distance - perigee_distance)
-        distance_factor = max(0.0, min(1.0, distance_factor))  # Clamp to valid range
-        
-        # Calculate breathing rate: faster at perigee (closer), slower at apogee (farther)
-        base_rate = self.LUNAR_BREATHING_RATE['base_rate_bpm']
-        max_rate = self.LUNAR_BREATHING_RATE['max_rate_bpm']
-        breathing_rate = base_rate + (distance_factor * (max_rate - base_rate))
-        
-        return breathing_rate
+        return _lunar_breathing_rate(astronomical_data.lunar_distance_km)
     
     def get_seasonal_coefficient(self, current_date: datetime.date) -> float:
-        """Calculate seasonal breathing duration coefficient"""
-        days_since_winter_solstice = self._calculate_days_since_winter(current_date)
-        return self._interpolate_between_solstices(
-            days_since_winter_solstice,
+        """Calculate seasonal breathing duration coefficient (memoized per date)"""
+        return _seasonal_coefficient(
+            current_date,
             self.WINTER_SOLSTICE_COEFFICIENT,
             self.SUMMER_SOLSTICE_COEFFICIENT
         )
     
     def calculate_muggy_factor(self, dewpoint_f: float) -> float:
         """Dewpoint 56°F+ fade-in, max discomfort ~75°F"""
-        if dewpoint_f < 56:
-            return 0.0
-        elif dewpoint_f > 75:
-            return 1.0
-        else:
-            return (dewpoint_f - 56) / (75 - 56)
-    
+        return _muggy_factor(dewpoint_f)
+
     def calculate_dryness_factor(self, dewpoint_f: float) -> float:
         """Crisp air effect for low dewpoints"""
-        if dewpoint_f > 45:
-            return 0.0
-        elif dewpoint_f < 20:
-            return 1.0
-        else:
-            return (45 - dewpoint_f) / (45 - 20)
-    
-    def apply_environmental_effects(self, environmental_data: EnvironmentalData) -> Dict:
+        return _dryness_factor(dewpoint_f)
+
+    def apply_environmental_effects(self, environmental_data: EnvironmentalData) -> EnvEffects:
         """Apply weather-based modifications to breathing patterns"""
-        muggy_factor = self.calculate_muggy_factor(environmental_data.dewpoint)
-        dryness_factor = self.calculate_dryness_factor(environmental_data.dewpoint)
-        pressure_factor = (environmental_data.barometric_pressure - 29.92) / 2.0  # normalized
-        cloud_factor = environmental_data.cloud_cover_percentage / 100.0
-        
-        # Breathing effort (muggy nights = more labored)
-        effort_multiplier = 1.0 + (muggy_factor * 0.15)
-        
-        # Breathing depth (pressure-based) - this affects brown noise amplitude
-        depth_adjustment = pressure_factor * 0.1
-        depth_adjustment += dryness_factor * 0.1  # Crisp air = deeper breathing
-        depth_adjustment -= muggy_factor * 0.1    # Muggy air = shallower breathing
-        
-        # Saturation adjustment
-        saturation_adjustment = (muggy_factor * 0.2) - (dryness_factor * 0.15) + (cloud_factor * 0.1)
-        
+        return _environmental_effects(
+            environmental_data.dewpoint,
+            environmental_data.barometric_pressure,
+            environmental_data.cloud_cover_percentage
+        )
+
+    def apply_environmental_effects_batch(self, batch: EnvironmentalBatch) -> Dict[str, List]:
+        """Batched variant of apply_environmental_effects over column data
+
+        Returns one list per effect, aligned with the batch columns. Factors use
+        branchless clamps so each column is a single sweep over contiguous data.
+        """
+        muggy = [max(0.0, min(1.0, (dewpoint - 56.0) * _INV_MUGGY_RANGE)) for dewpoint in batch.dewpoint]
+        dryness = [max(0.0, min(1.0, (45.0 - dewpoint) * _INV_DRYNESS_RANGE)) for dewpoint in batch.dewpoint]
+        depth = [
+            (pressure - _PRESSURE_REFERENCE) * _INV_PRESSURE_SCALE * 0.1 + dry * 0.1 - mug * 0.1
+            for pressure, dry, mug in zip(batch.barometric_pressure, dryness, muggy)
+        ]
         return {
-            'depth_adjustment': depth_adjustment,
-            'saturation_adjustment': saturation_adjustment,
-            'effort_multiplier': effort_multiplier,
-            'extreme_humidity_flash': environmental_data.dewpoint >= 79.0,  # Circuit overload effect
-            'brown_noise_amplitude_factor': 1.0 + depth_adjustment  # For audio system integration
+            'depth_adjustment': depth,
+            'saturation_adjustment': [
+                mug * 0.2 - dry * 0.15 + cloud * _INV_CLOUD_SCALE * 0.1
+                for mug, dry, cloud in zip(muggy, dryness, batch.cloud_cover_percentage)
+            ],
+            'effort_multiplier': [1.0 + mug * 0.15 for mug in muggy],
+            'extreme_humidity_flash': [dewpoint >= 79.0 for dewpoint in batch.dewpoint],
+            'brown_noise_amplitude_factor': [1.0 + adjustment for adjustment in depth],
         }
     
-    def calculate_rgb_output(self, module_name: str, breath_phase: float, 
+    def calculate_rgb_output(self, module_name: str, breath_phase: float,
                            heartbeat_phase: bool, environmental_data: EnvironmentalData,
-                           astronomical_data: AstronomicalData) -> Dict:
-        """Complete RGB calculation with weekly architecture and environmental modulations"""
-        current_date = datetime.date.today()
-        
-        # Get current day's color schedule
-        day_schedule = self.get_current_day_schedule(current_date, self.track_type)
-        
+                           astronomical_data: AstronomicalData,
+                           today: Optional[datetime.date] = None,
+                           env_effects: Optional[EnvEffects] = None) -> RGBOutput:
+        """Complete RGB calculation with weekly architecture and environmental modulations
+
+        Callers that already hold the current date or the tick's environmental
+        effects (the track coordinator computes both once per tick) pass them
+        via `today`/`env_effects` to skip the recomputation.
+        """
+        current_date = today if today is not None else datetime.date.today()
+
+        # Get current day's color schedule (cached per day)
+        day_schedule = self._daily_state(current_date)
+
         # Environmental adjustments
-        env_effects = self.apply_environmental_effects(environmental_data)
-        
-        # Calculate base colors based on breathing mode
-        if day_schedule.mode == BreathingMode.RGB_BREATHING:
-            # Sunday grey breathing mode
-            exhale_rgb = self.rgb_to_normalized(day_schedule.exhale_rgb)
-            inhale_rgb = self.rgb_to_normalized(day_schedule.inhale_rgb)
-            
-            # Interpolate between exhale and inhale colors based on breath phase
-            breath_factor = (math.sin(breath_phase) + 1.0) / 2.0  # 0.0 to 1.0
-            base_rgb = tuple(
-                exhale_rgb[i] + breath_factor * (inhale_rgb[i] - exhale_rgb[i]) 
-                for i in range(3)
-            )
-            final_temp = 2200  # Approximate temperature for logging purposes
-            
-        else:
-            # Kelvin-based breathing mode
-            module_colors = getattr(day_schedule, module_name, None)
-            if not module_colors:
-                # Fallback to emergency colors
-                base_rgb = (1.0, 0.7, 0.3)  # Warm amber
-                final_temp = 2200
-            else:
-                # Interpolate between exhale and inhale temperatures based on breath phase
-                breath_factor = (math.sin(breath_phase) + 1.0) / 2.0  # 0.0 to 1.0
-                exhale_temp = module_colors['exhale_k']
-                inhale_temp = module_colors['inhale_k']
-                current_temp = exhale_temp + breath_factor * (inhale_temp - exhale_temp)
-                
-                base_rgb = self.kelvin_to_rgb(current_temp)
-                final_temp = current_temp
-        
-        # Breathing modulation (brightness based on environmental depth)
-        base_breathing_multiplier = 0.8 + 0.2 * math.sin(breath_phase)
-        breathing_multiplier = base_breathing_multiplier * (1.0 + env_effects['depth_adjustment'])
-        
-        # Heartbeat overlay
-        heartbeat_additive = 0.2 if heartbeat_phase else 0.0
-        
-        # Extreme humidity electrical flash
-        if env_effects['extreme_humidity_flash'] and abs(math.sin(breath_phase)) > 0.95:
-            # Circuit overload flash at breath apex (reuse sympathetic lightning colors)
-            base_rgb = (0.8, 0.9, 1.0)  # Blue-tinged white
-            breathing_multiplier = 1.0
-            heartbeat_additive = 0.0
-        
-        # Final brightness calculation
-        final_brightness = min(breathing_multiplier + heartbeat_additive, 1.0)
-        
+        if env_effects is None:
+            env_effects = self.apply_environmental_effects(environmental_data)
+
+        red, green, blue, brightness, final_temp = self._frame_for_module(
+            module_name, breath_phase, heartbeat_phase, env_effects
+        )
+
         # Calculate lunar breathing rate for audio system coordination
         breathing_rate_bpm = self.calculate_lunar_breathing_rate(astronomical_data)
-        
-        return {
-            'rgb': base_rgb,
-            'brightness': max(final_brightness, 0.1),
-            'temperature_k': final_temp,
-            'environmental_effects': env_effects,
-            'breathing_rate_bpm': breathing_rate_bpm,
-            'day_schedule': day_schedule.description,
-            'track_type': self.track_type.value,
-            'brown_noise_amplitude': env_effects['brown_noise_amplitude_factor']
-        }
+
+        return RGBOutput(
+            rgb=(red, green, blue),
+            brightness=brightness,
+            temperature_k=final_temp,
+            environmental_effects=env_effects,
+            breathing_rate_bpm=breathing_rate_bpm,
+            day_schedule=day_schedule.description,
+            track_type=self.track_type.value,
+            brown_noise_amplitude=env_effects.brown_noise_amplitude_factor,
+            packed=pack_rgba((red, green, blue), brightness)
+        )
+
+    def _frame_for_module(self, module_name: str, breath_phase: float,
+                          heartbeat_phase: bool,
+                          env_effects: EnvEffects) -> Tuple[float, float, float, float, float]:
+        """One frame for a module given already-resolved shared state
+
+        Both breathing modes resolve to the same per-day waveform tables, so
+        there is no mode dispatch here: one table fetch for the quantized
+        phase, then _finalize_frame for the inputs that stay dynamic. Only
+        unknown modules fall back to live math (warm amber emergency colors).
+        """
+        table = self._phase_tables.get(module_name)
+        if table is not None:
+            red, green, blue, current_temp, breath_sin = table[
+                int(breath_phase * _PHASE_INDEX_SCALE) & _PHASE_MASK
+            ]
+            red, green, blue, brightness = _finalize_frame(
+                red, green, blue, breath_sin, heartbeat_phase, env_effects
+            )
+            return red, green, blue, brightness, current_temp
+
+        # Fallback to emergency colors
+        red, green, blue, brightness = _finalize_frame(
+            1.0, 0.7, 0.3, math.sin(breath_phase), heartbeat_phase, env_effects  # Warm amber
+        )
+        return red, green, blue, brightness, 2200
+
+    def calculate_rgb_output_dual(self, other_engine: 'RhythmEngineCore', module_name: str,
+                                  breath_phase: float, heartbeat_phase: bool,
+                                  environmental_data: EnvironmentalData,
+                                  astronomical_data: AstronomicalData,
+                                  today: Optional[datetime.date] = None
+                                  ) -> Tuple[RGBOutput, RGBOutput]:
+        """Compute this engine's and a partner engine's output in one pass
+
+        Indoor and outdoor tracks share everything per tick except the day
+        schedule (Sunday indoor inheritance) and track type, so the date,
+        environmental effects, and lunar breathing rate are each computed once
+        here instead of once per track.
+        """
+        current_date = today if today is not None else datetime.date.today()
+        env_effects = self.apply_environmental_effects(environmental_data)
+        breathing_rate_bpm = self.calculate_lunar_breathing_rate(astronomical_data)
+
+        outputs = []
+        for engine in (self, other_engine):
+            day_schedule = engine._daily_state(current_date)
+            red, green, blue, brightness, final_temp = engine._frame_for_module(
+                module_name, breath_phase, heartbeat_phase, env_effects
+            )
+            outputs.append(RGBOutput(
+                rgb=(red, green, blue),
+                brightness=brightness,
+                temperature_k=final_temp,
+                environmental_effects=env_effects,
+                breathing_rate_bpm=breathing_rate_bpm,
+                day_schedule=day_schedule.description,
+                track_type=engine.track_type.value,
+                brown_noise_amplitude=env_effects.brown_noise_amplitude_factor,
+                packed=pack_rgba((red, green, blue), brightness)
+            ))
+        return outputs[0], outputs[1]
     
+    def calculate_rgb_output_batch(self, module_name: str, breath_phases: List[float],
+                                   heartbeat_phase: bool, environmental_data: EnvironmentalData,
+                                   astronomical_data: AstronomicalData) -> List[Tuple[float, float, float, float, float]]:
+        """Batched RGB calculation: one row (r, g, b, brightness, temperature_k) per breath phase
+
+        Amortizes the per-tick setup (day schedule, environmental effects, heartbeat)
+        across all phases so many modules or frames can be computed in one call.
+        """
+        current_date = datetime.date.today()
+        self._daily_state(current_date)
+        env_effects = self.apply_environmental_effects(environmental_data)
+
+        # The per-day tables cover both breathing modes, so one loop serves all
+        table = self._phase_tables.get(module_name)
+        rows = []
+        for breath_phase in breath_phases:
+            if table is not None:
+                red, green, blue, current_temp, breath_sin = table[
+                    int(breath_phase * _PHASE_INDEX_SCALE) & _PHASE_MASK
+                ]
+                red, green, blue, brightness = _finalize_frame(
+                    red, green, blue, breath_sin, heartbeat_phase, env_effects
+                )
+                rows.append((red, green, blue, brightness, current_temp))
+            else:
+                red, green, blue, brightness = _finalize_frame(
+                    1.0, 0.7, 0.3, math.sin(breath_phase),
+                    heartbeat_phase, env_effects  # Warm amber fallback
+                )
+                rows.append((red, green, blue, brightness, 2200))
+
+        return rows
+
+    def calculate_all_modules_output(self, breath_phase: float, heartbeat_phase: bool,
+                                     environmental_data: EnvironmentalData,
+                                     astronomical_data: AstronomicalData) -> Dict[str, Tuple[float, float, float, float, float]]:
+        """Update every breathing module for one tick in a single call
+
+        Shares the day schedule, environmental effects, and breath sine across
+        all modules, so a full tick costs one setup pass plus one fused kernel
+        call per module.
+        """
+        current_date = datetime.date.today()
+        day_schedule = self._daily_state(current_date)
+        env_effects = self.apply_environmental_effects(environmental_data)
+
+        if day_schedule.mode is _RGB_BREATHING:
+            # Grey breathing: every module shares the day's single waveform
+            # table, so one frame serves all of them
+            frame = self._frame_for_module(
+                self._MODULE_NAMES[0], breath_phase, heartbeat_phase, env_effects
+            )
+            return {name: frame for name in self._MODULE_NAMES}
+
+        # One quantized phase index shared by every module's waveform table
+        phase_index = int(breath_phase * _PHASE_INDEX_SCALE) & _PHASE_MASK
+        results = {}
+        for name in self._MODULE_NAMES:
+            table = self._phase_tables.get(name)
+            if table is not None:
+                red, green, blue, current_temp, breath_sin = table[phase_index]
+                red, green, blue, brightness = _finalize_frame(
+                    red, green, blue, breath_sin, heartbeat_phase, env_effects
+                )
+                results[name] = (red, green, blue, brightness, current_temp)
+            else:
+                red, green, blue, brightness = _finalize_frame(
+                    1.0, 0.7, 0.3, math.sin(breath_phase),
+                    heartbeat_phase, env_effects  # Warm amber fallback
+                )
+                results[name] = (red, green, blue, brightness, 2200)
+        return results
+
     def should_lights_be_on(self, current_time: datetime.datetime, astronomical_data: AstronomicalData) -> bool:
         """Determine if lights should be on based on track type and time of day"""
-        current_date = current_time.date()
-        day_name = calendar.day_name[current_date.weekday()].lower()
-        
-        # Check if we're in daytime (between golden hours)
-        is_daytime = (astronomical_data.golden_hour_end < current_time < astronomical_data.golden_hour_begin)
-        
-        if self.track_type == TrackType.INDOOR:
+        if self.track_type is _INDOOR:
             # Indoor lights are always on
             return True
-            
-        elif self.track_type == TrackType.OUTDOOR:
-            if day_name in ['saturday', 'sunday']:
-                # Saturday and Sunday: on all day for contrast
-                return True
-            else:
-                # Monday through Friday: off during golden hour periods
-                return not is_daytime
-        
-        return True  # Default fallback
+
+        if self._IS_WEEKEND[current_time.date().weekday()]:
+            # Saturday and Sunday: on all day for contrast
+            return True
+
+        # Monday through Friday: off during golden hour periods (daytime)
+        return not (astronomical_data.golden_hour_end < current_time < astronomical_data.golden_hour_begin)
     
     def handle_failures_gracefully(self):
         """Cascade through fallback layers for 'nearly unbreakable' operation"""
-        for layer in self.fallback_layers:
+        for fallback_fn in self._fallback_fns:
             try:
-                if layer == 'astronomical_api':
-                    return self.fetch_api_data()
-                elif layer == 'local_calculations':
-                    return self.calculate_local_solar_times()
-                elif layer == 'cached_data':
-                    return self.load_cached_astronomical_data()
-                elif layer == 'emergency_breathing':
-                    return self.activate_priority_99_breathing()
+                return fallback_fn()
             except Exception:
                 continue
-        
+
         # Last resort: simple amber sine wave
         return self.absolute_fallback_breathing()
     
-    # TODO: Implement these helper methods
     def _calculate_days_since_winter(self, date: datetime.date) -> int:
-        """Calculate days since winter solstice"""
-        # TODO: Implement proper solstice calculation
-        pass
-    
+        """Calculate days since the most recent winter solstice"""
+        return _days_since_winter_solstice(date)
+
     def _interpolate_between_solstices(self, days: int, winter_coeff: float, summer_coeff: float) -> float:
-        """Linear interpolation between solstice coefficients"""
-        # TODO: Implement interpolation logic
-        pass
-    
+        """Cosine interpolation between solstice coefficients across the year"""
+        return _interpolate_solstice_coefficients(days, winter_coeff, summer_coeff)
+
+    # TODO: Implement these helper methods
+
     def fetch_api_data(self):
         """Fetch astronomical data from external API"""
         pass
@@ -406,15 +903,20 @@ class RhythmEngineCore:
         """Emergency fallback breathing pattern"""
         pass
     
-    def absolute_fallback_breathing(self):
+    def absolute_fallback_breathing(self) -> RGBOutput:
         """Final fallback: simple amber sine wave"""
-        return {
-            'rgb': (1.0, 0.7, 0.3),  # Warm amber
-            'brightness': 0.8 + 0.2 * math.sin(datetime.datetime.now().timestamp() / 4.0),
-            'temperature_k': 2200,
-            'breathing_rate_bpm': 11.0,  # Middle of lunar range
-            'brown_noise_amplitude': 1.0
-        }
+        brightness = 0.8 + 0.2 * math.sin(time.monotonic() * 0.25)
+        return RGBOutput(
+            rgb=(1.0, 0.7, 0.3),  # Warm amber
+            brightness=brightness,
+            temperature_k=2200,
+            environmental_effects=_NEUTRAL_ENV_EFFECTS,
+            breathing_rate_bpm=11.0,  # Middle of lunar range
+            day_schedule="Absolute fallback - simple amber breathing",
+            track_type=self.track_type.value,
+            brown_noise_amplitude=1.0,
+            packed=pack_rgba((1.0, 0.7, 0.3), brightness)
+        )
 
 
 class TrackCoordinator:
@@ -425,17 +927,24 @@ class TrackCoordinator:
         self.outdoor_engine = RhythmEngineCore(TrackType.OUTDOOR)
         self.shared_breath_phase = 0.0
         self.shared_heartbeat_phase = False
-    
+        # Clock read once per tick and shared with both engines
+        self._tick_now: Optional[datetime.datetime] = None
+        self._tick_today: Optional[datetime.date] = None
+
     def update_shared_timing(self, astronomical_data: AstronomicalData):
         """Update synchronized breathing and heartbeat timing for both tracks"""
         current_time = datetime.datetime.now()
-        
-        # Calculate breathing rate from lunar distance (same for both tracks)
+        self._tick_now = current_time
+        self._tick_today = current_time.date()
+
+        # Calculate breathing rate from lunar distance (same for both tracks;
+        # the kernel is memoized on the distance, so this is usually a cache hit)
         breathing_rate_bpm = self.indoor_engine.calculate_lunar_breathing_rate(astronomical_data)
-        breathing_rate_hz = breathing_rate_bpm / 60.0
-        
-        # Update shared breath phase
-        self.shared_breath_phase = (current_time.timestamp() * breathing_rate_hz * 2 * math.pi) % (2 * math.pi)
+
+        # Update shared breath phase: one multiply plus a libm fmod
+        self.shared_breath_phase = math.fmod(
+            current_time.timestamp() * breathing_rate_bpm * _TWO_PI_OVER_60, _TWO_PI
+        )
         
         # TODO: Implement heartbeat timing logic
         self.shared_heartbeat_phase = False
@@ -444,15 +953,13 @@ class TrackCoordinator:
                              astronomical_data: AstronomicalData, module_name: str) -> Dict:
         """Get coordinated output for both tracks with synchronized timing"""
         self.update_shared_timing(astronomical_data)
-        
-        indoor_output = self.indoor_engine.calculate_rgb_output(
-            module_name, self.shared_breath_phase, self.shared_heartbeat_phase,
-            environmental_data, astronomical_data
-        )
-        
-        outdoor_output = self.outdoor_engine.calculate_rgb_output(
-            module_name, self.shared_breath_phase, self.shared_heartbeat_phase,
-            environmental_data, astronomical_data
+
+        # Both tracks in one pass: environmental effects, breath sine, and
+        # lunar rate are computed once and shared
+        indoor_output, outdoor_output = self.indoor_engine.calculate_rgb_output_dual(
+            self.outdoor_engine, module_name, self.shared_breath_phase,
+            self.shared_heartbeat_phase, environmental_data, astronomical_data,
+            today=self._tick_today
         )
         
         return {
@@ -461,7 +968,7 @@ class TrackCoordinator:
             'shared_timing': {
                 'breath_phase': self.shared_breath_phase,
                 'heartbeat_phase': self.shared_heartbeat_phase,
-                'breathing_rate_bpm': indoor_output['breathing_rate_bpm']
+                'breathing_rate_bpm': indoor_output.breathing_rate_bpm
             }
         }
 